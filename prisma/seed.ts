@@ -3,7 +3,7 @@ import bcrypt from "bcryptjs";
 
 const prisma = new PrismaClient();
 
-const unitTemplates = [
+export const unitTemplates = [
   { rooms: 1, area: 35, position: 0 },
   { rooms: 2, area: 54, position: 1 },
   { rooms: 3, area: 78, position: 2 },
@@ -12,19 +12,19 @@ const unitTemplates = [
   { rooms: 1, area: 38, position: 5 },
 ];
 
-const statuses = ["available", "available", "available", "available", "reserved", "reserved", "sold"];
+export const statuses = ["available", "available", "available", "available", "reserved", "reserved", "sold"];
 
-async function main() {
-  // Clear existing data
-  await prisma.unit.deleteMany();
-  await prisma.floor.deleteMany();
-  await prisma.building.deleteMany();
-  await prisma.project.deleteMany();
-  await prisma.user.deleteMany();
+export async function clearDatabase(client: PrismaClient) {
+  await client.unit.deleteMany();
+  await client.floor.deleteMany();
+  await client.building.deleteMany();
+  await client.project.deleteMany();
+  await client.user.deleteMany();
+}
 
-  // Create superadmin
+export async function createSuperadmin(client: PrismaClient) {
   const hashedPassword = await bcrypt.hash("admin123", 10);
-  await prisma.user.create({
+  await client.user.create({
     data: {
       email: "admin@navruz.uz",
       password: hashedPassword,
@@ -32,25 +32,23 @@ async function main() {
       role: "superadmin",
     },
   });
+}
 
-  // Create project
-  const project = await prisma.project.create({
-    data: {
-      name: "Navruz Residence",
-      description:
-        "Premium residential complex in the heart of Tashkent. Modern architecture, green areas, underground parking, children's playground, and 24/7 security. Located near Amir Temur Square with easy access to metro, schools, and shopping centers.",
-      address: "Tashkent, Mirzo Ulugbek district, Buyuk Ipak Yuli 123",
-      // Sample aerial view - admin can upload real image
-      topViewImage: null,
-    },
-  });
+// Create a building with `floorCount` floors and 6 units per floor.
+// `random` lets callers make the status mix reproducible.
+export async function seedBuilding(
+  client: PrismaClient,
+  options: { projectId: string; name: string; floorCount: number; sortOrder?: number; random?: () => number }
+) {
+  const { projectId, name, floorCount, sortOrder = 0, random = Math.random } = options;
 
   // Create building with position data (for clickable area on aerial view)
   // Position is percentage-based: x, y, width, height relative to image
-  const building = await prisma.building.create({
+  const building = await client.building.create({
     data: {
-      name: "Block A",
-      projectId: project.id,
+      name,
+      projectId,
+      sortOrder,
       // Building facade images - admin can upload
       frontViewImage: null,
       backViewImage: null,
@@ -59,19 +57,20 @@ async function main() {
     },
   });
 
-  // Create 9 floors with units
-  for (let floorNum = 1; floorNum <= 9; floorNum++) {
+  // Each floor takes an equal slice of the facade, starting from 10%
+  const step = 81 / floorCount;
+
+  for (let floorNum = 1; floorNum <= floorCount; floorNum++) {
     let basePricePerM2: number;
     if (floorNum <= 3) basePricePerM2 = 8_000_000;
     else if (floorNum <= 6) basePricePerM2 = 10_000_000;
     else basePricePerM2 = 12_000_000;
 
     // Calculate floor position on building facade (percentage from bottom)
-    // 9 floors, so each floor takes about 10% of height, starting from 10%
-    const yEnd = 90 - (floorNum - 1) * 9;
-    const yStart = yEnd - 8;
+    const yEnd = 90 - (floorNum - 1) * step;
+    const yStart = yEnd - step + 1;
 
-    const floor = await prisma.floor.create({
+    const floor = await client.floor.create({
       data: {
         number: floorNum,
         buildingId: building.id,
@@ -84,35 +83,58 @@ async function main() {
     });
 
     // Create 6 units per floor
-    for (const template of unitTemplates) {
-      const unitNum = `${floorNum}0${template.position + 1}`;
-      const status = statuses[Math.floor(Math.random() * statuses.length)];
-
-      // Corner units (position 0 and 5) get 15% premium
-      const isCorner = template.position === 0 || template.position === 5;
-      const priceOverride = isCorner ? basePricePerM2 * 1.15 : undefined;
-
-      await prisma.unit.create({
-        data: {
-          unitNumber: unitNum,
+    await client.unit.createMany({
+      data: unitTemplates.map((template) => {
+        // Corner units (position 0 and 5) get 15% premium
+        const isCorner = template.position === 0 || template.position === 5;
+        return {
+          unitNumber: `${floorNum}0${template.position + 1}`,
           floorId: floor.id,
           rooms: template.rooms,
           area: template.area,
-          status,
-          pricePerM2: priceOverride,
-        },
-      });
-    }
+          status: statuses[Math.floor(random() * statuses.length)],
+          pricePerM2: isCorner ? basePricePerM2 * 1.15 : undefined,
+        };
+      }),
+    });
   }
 
-  console.log("✅ Seed completed: 1 project, 1 building, 9 floors, 54 units, 1 superadmin");
+  return building;
 }
 
-main()
-  .catch((e) => {
-    console.error(e);
-    process.exit(1);
-  })
-  .finally(async () => {
-    await prisma.$disconnect();
+async function main() {
+  // Clear existing data
+  await clearDatabase(prisma);
+
+  // Create superadmin
+  await createSuperadmin(prisma);
+
+  // Create project
+  const project = await prisma.project.create({
+    data: {
+      name: "Navruz Residence",
+      description:
+        "Premium residential complex in the heart of Tashkent. Modern architecture, green areas, underground parking, children's playground, and 24/7 security. Located near Amir Temur Square with easy access to metro, schools, and shopping centers.",
+      address: "Tashkent, Mirzo Ulugbek district, Buyuk Ipak Yuli 123",
+      // Sample aerial view - admin can upload real image
+      topViewImage: null,
+    },
   });
+
+  // Create 9 floors with units
+  await seedBuilding(prisma, { projectId: project.id, name: "Block A", floorCount: 9 });
+
+  console.log("✅ Seed completed: 1 project, 1 building, 9 floors, 54 units, 1 superadmin");
+}
+
+// Only run when executed directly (the load-test seeder imports the helpers above)
+if (require.main === module) {
+  main()
+    .catch((e) => {
+      console.error(e);
+      process.exit(1);
+    })
+    .finally(async () => {
+      await prisma.$disconnect();
+    });
+}
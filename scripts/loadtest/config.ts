@@ -0,0 +1,47 @@
+import fs from "fs";
+import path from "path";
+
+export interface Budget {
+  p95?: number; // ms
+  p99?: number; // ms
+  maxErrorRate?: number; // 0-1
+}
+
+export interface LoadTestConfig {
+  baseUrl: string;
+  seed: number;
+  dataset: {
+    projects: number;
+    buildingsPerProject: number;
+    floorsPerBuilding: number;
+  };
+  run: {
+    concurrency: number;
+    warmupSeconds: number;
+    durationSeconds: number;
+  };
+  flows: Record<string, number>; // flow name -> relative weight
+  budgets: Record<string, Budget>; // route label (or "default") -> budget
+}
+
+export function loadConfig(): LoadTestConfig {
+  const file = process.env.LOADTEST_CONFIG || path.join(__dirname, "config.json");
+  const config: LoadTestConfig = JSON.parse(fs.readFileSync(file, "utf8"));
+
+  // Env overrides for quick local runs
+  if (process.env.LOADTEST_BASE_URL) config.baseUrl = process.env.LOADTEST_BASE_URL;
+  if (process.env.LOADTEST_CONCURRENCY) config.run.concurrency = parseInt(process.env.LOADTEST_CONCURRENCY);
+  if (process.env.LOADTEST_DURATION) config.run.durationSeconds = parseInt(process.env.LOADTEST_DURATION);
+
+  return config;
+}
+
+// Small deterministic PRNG so the dataset and the traffic mix are reproducible
+export function mulberry32(seed: number) {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
@@ -0,0 +1,296 @@
+import { spawn, ChildProcess } from "child_process";
+import fs from "fs";
+import { PrismaClient } from "@prisma/client";
+import { Budget, loadConfig, LoadTestConfig, mulberry32 } from "./config";
+
+// Replays visitor and admin flows against a local server and reports
+// throughput and p50/p95/p99 per route. Exits with code 1 if a latency
+// budget from config.json is exceeded.
+//
+//   npm run loadtest                 # server already running at baseUrl
+//   npm run loadtest -- --start-server   # start `next start` with AI/upload keys stubbed out
+
+// External services are blanked so nothing leaves the machine.
+// (NEXT_PUBLIC_* values are inlined at build time — build with the same env.)
+const STUB_ENV: Record<string, string> = {
+  GEMINI_API_KEY: "",
+  OPENAI_API_KEY: "",
+  CLOUDINARY_CLOUD_NAME: "",
+  CLOUDINARY_API_KEY: "",
+  CLOUDINARY_API_SECRET: "",
+  NEXT_PUBLIC_SHOW_AI: "false",
+  NEXT_PUBLIC_POSTHOG_KEY: "",
+  NEXT_PUBLIC_POSTHOG_HOST: "",
+  NEXT_TELEMETRY_DISABLED: "1",
+};
+
+const ADMIN_BASE = "/portal/management-x7k9";
+
+interface RouteStats {
+  latencies: number[];
+  errors: number;
+}
+
+interface Fixtures {
+  projectId: string;
+  projectName: string;
+  buildingIds: string[];
+  units: { id: string; unitNumber: string; floor: { buildingId: string } }[];
+  unitPages: number;
+}
+
+// Resolves to the response body when the status is acceptable, otherwise null
+type RequestFn = (
+  label: string,
+  path: string,
+  init?: { method?: string; headers?: Record<string, string>; body?: string },
+  okStatuses?: number[]
+) => Promise<string | null>;
+
+type Flow = (request: RequestFn, fx: Fixtures, random: () => number) => Promise<void>;
+
+const pick = <T>(items: T[], random: () => number) => items[Math.floor(random() * items.length)];
+
+const flows: Record<string, Flow> = {
+  home: async (request) => {
+    await request("GET /", "/");
+  },
+  // Filtering on /kvartiralar happens in the browser, so the page payload is what the server pays for
+  apartments: async (request) => {
+    await request("GET /kvartiralar", "/kvartiralar");
+  },
+  vizual: async (request, fx, random) => {
+    await request("GET /vizual", `/vizual?buildingId=${pick(fx.buildingIds, random)}`);
+  },
+  // Unit modals render from the page payload; their only server call is the lead form.
+  // The visitor opens the unit's page (/vizual or /kvartiralar), then submits a lead from the modal.
+  lead: async (request, fx, random) => {
+    const unit = pick(fx.units, random);
+    if (random() < 0.5) {
+      await request("GET /vizual", `/vizual?buildingId=${unit.floor.buildingId}`);
+    } else {
+      await request("GET /kvartiralar", "/kvartiralar");
+    }
+    await request("POST /api/leads", "/api/leads", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        name: "Loadtest",
+        phone: "+998900000000",
+        projectId: fx.projectId,
+        projectName: fx.projectName,
+        unitId: unit.id,
+        unitNumber: unit.unitNumber,
+        source: "loadtest",
+      }),
+    });
+  },
+  adminBulkStatus: async (request, fx, random) => {
+    await request("GET /portal/.../units", `${ADMIN_BASE}/projects/${fx.projectId}/units`);
+
+    const page = 1 + Math.floor(random() * fx.unitPages);
+    const body = await request(
+      "GET /api/units?page",
+      `/api/units?projectId=${fx.projectId}&page=${page}&limit=20`
+    );
+    if (!body) return;
+    const { data } = JSON.parse(body);
+    if (!data?.length) return;
+
+    // Another agent may have touched the same units — a 409 conflict is an expected outcome
+    await request(
+      "POST /api/units/batch",
+      "/api/units/batch",
+      {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          changes: data.map((u: { id: string; updatedAt: string }) => ({
+            id: u.id,
+            updatedAt: u.updatedAt,
+            data: { status: pick(["available", "reserved", "sold"], random) },
+          })),
+        }),
+      },
+      [409]
+    );
+  },
+};
+
+async function loadFixtures(): Promise<Fixtures> {
+  const prisma = new PrismaClient();
+  try {
+    // Same lookup the public pages use (getCachedProject)
+    const project = await prisma.project.findFirst({ select: { id: true, name: true } });
+    if (!project) throw new Error("No project found — run `npm run loadtest:seed` first");
+
+    const where = { floor: { building: { projectId: project.id } } };
+    const [buildings, units, unitCount] = await Promise.all([
+      prisma.building.findMany({ where: { projectId: project.id }, select: { id: true } }),
+      prisma.unit.findMany({
+        where,
+        select: { id: true, unitNumber: true, floor: { select: { buildingId: true } } },
+        take: 5000,
+      }),
+      prisma.unit.count({ where }),
+    ]);
+
+    return {
+      projectId: project.id,
+      projectName: project.name,
+      buildingIds: buildings.map((b) => b.id),
+      units,
+      unitPages: Math.max(1, Math.ceil(unitCount / 20)),
+    };
+  } finally {
+    await prisma.$disconnect();
+  }
+}
+
+async function startServer(baseUrl: string): Promise<ChildProcess> {
+  const port = new URL(baseUrl).port || "3000";
+  const server = spawn("npx", ["next", "start", "-p", port], {
+    env: { ...process.env, ...STUB_ENV },
+    stdio: "inherit",
+  });
+
+  const deadline = Date.now() + 60_000;
+  while (Date.now() < deadline) {
+    try {
+      const res = await fetch(baseUrl);
+      if (res.ok) return server;
+    } catch {
+      // not listening yet
+    }
+    await new Promise((r) => setTimeout(r, 500));
+  }
+  server.kill();
+  throw new Error(`Server did not start at ${baseUrl} (did you run \`npm run build\`?)`);
+}
+
+function percentile(sorted: number[], p: number) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1)];
+}
+
+async function runLoad(config: LoadTestConfig, fx: Fixtures) {
+  const stats = new Map<string, RouteStats>();
+  const { concurrency, warmupSeconds, durationSeconds } = config.run;
+  const measureFrom = Date.now() + warmupSeconds * 1000;
+  const endAt = measureFrom + durationSeconds * 1000;
+
+  const flowNames = Object.keys(config.flows).filter((name) => flows[name] && config.flows[name] > 0);
+  const totalWeight = flowNames.reduce((s, name) => s + config.flows[name], 0);
+
+  const request: RequestFn = async (label, path, init, okStatuses = []) => {
+    const started = performance.now();
+    let body: string | null = null;
+    let ok = false;
+    try {
+      const res = await fetch(config.baseUrl + path, {
+        ...init,
+        headers: { Cookie: "locale=uz", ...init?.headers },
+      });
+      // Read the whole body so transfer time is included
+      body = await res.text();
+      ok = res.ok || okStatuses.includes(res.status);
+    } catch {
+      // Connection errors count as failed requests
+    }
+    const elapsed = performance.now() - started;
+
+    if (Date.now() >= measureFrom) {
+      let route = stats.get(label);
+      if (!route) stats.set(label, (route = { latencies: [], errors: 0 }));
+      route.latencies.push(elapsed);
+      if (!ok) route.errors++;
+    }
+    return ok ? body : null;
+  };
+
+  const virtualUser = async (vu: number) => {
+    const random = mulberry32(config.seed + vu);
+    while (Date.now() < endAt) {
+      let roll = random() * totalWeight;
+      const name = flowNames.find((n) => (roll -= config.flows[n]) < 0) ?? flowNames[0];
+      await flows[name](request, fx, random);
+    }
+  };
+
+  console.log(
+    `Running ${concurrency} virtual users for ${durationSeconds}s (+${warmupSeconds}s warmup) against ${config.baseUrl}`
+  );
+  await Promise.all(Array.from({ length: concurrency }, (_, i) => virtualUser(i)));
+  return stats;
+}
+
+function report(config: LoadTestConfig, stats: Map<string, RouteStats>) {
+  const duration = config.run.durationSeconds;
+  const rows = Array.from(stats.entries()).map(([label, s]) => {
+    const sorted = [...s.latencies].sort((a, b) => a - b);
+    const budget: Budget = { ...config.budgets.default, ...config.budgets[label] };
+    const result = {
+      route: label,
+      requests: sorted.length,
+      rps: sorted.length / duration,
+      errorRate: sorted.length ? s.errors / sorted.length : 0,
+      p50: percentile(sorted, 50),
+      p95: percentile(sorted, 95),
+      p99: percentile(sorted, 99),
+      violations: [] as string[],
+    };
+    if (budget.p95 !== undefined && result.p95 > budget.p95) result.violations.push(`p95 > ${budget.p95}ms`);
+    if (budget.p99 !== undefined && result.p99 > budget.p99) result.violations.push(`p99 > ${budget.p99}ms`);
+    if (budget.maxErrorRate !== undefined && result.errorRate > budget.maxErrorRate) {
+      result.violations.push(`errors > ${(budget.maxErrorRate * 100).toFixed(1)}%`);
+    }
+    return result;
+  });
+
+  console.table(
+    rows.map((r) => ({
+      route: r.route,
+      requests: r.requests,
+      "req/s": r.rps.toFixed(1),
+      "err %": (r.errorRate * 100).toFixed(2),
+      "p50 ms": r.p50.toFixed(0),
+      "p95 ms": r.p95.toFixed(0),
+      "p99 ms": r.p99.toFixed(0),
+      budget: r.violations.length ? `❌ ${r.violations.join(", ")}` : "✅",
+    }))
+  );
+
+  const total = rows.reduce((s, r) => s + r.requests, 0);
+  console.log(`Total: ${total} requests, ${(total / duration).toFixed(1)} req/s`);
+
+  if (process.env.LOADTEST_OUT) {
+    fs.writeFileSync(process.env.LOADTEST_OUT, JSON.stringify({ config, routes: rows }, null, 2));
+    console.log(`Results written to ${process.env.LOADTEST_OUT}`);
+  }
+
+  return rows.some((r) => r.violations.length > 0);
+}
+
+async function main() {
+  const config = loadConfig();
+  const fixtures = await loadFixtures();
+  const server = process.argv.includes("--start-server") ? await startServer(config.baseUrl) : null;
+
+  try {
+    const stats = await runLoad(config, fixtures);
+    const failed = report(config, stats);
+    if (failed) {
+      console.error("❌ Latency budget exceeded");
+      process.exitCode = 1;
+    } else {
+      console.log("✅ All routes within budget");
+    }
+  } finally {
+    server?.kill();
+  }
+}
+
+main().catch((e) => {
+  console.error(e);
+  process.exit(1);
+});
@@ -0,0 +1,59 @@
+import { PrismaClient } from "@prisma/client";
+import { clearDatabase, createSuperadmin, seedBuilding } from "../../prisma/seed";
+import { loadConfig, mulberry32 } from "./config";
+
+// Seeds a large synthetic dataset for load testing.
+// Point DATABASE_URL at a local throwaway database — all existing data is deleted.
+
+const prisma = new PrismaClient();
+
+async function main() {
+  const { seed, dataset } = loadConfig();
+  const random = mulberry32(seed);
+  const started = Date.now();
+
+  await prisma.lead.deleteMany();
+  await clearDatabase(prisma);
+  await createSuperadmin(prisma);
+
+  for (let p = 1; p <= dataset.projects; p++) {
+    const project = await prisma.project.create({
+      data: {
+        name: `Loadtest Residence ${p}`,
+        description: "Synthetic project for load testing.",
+        address: `Tashkent, Loadtest street ${p}`,
+        topViewImage: null,
+      },
+    });
+
+    for (let b = 0; b < dataset.buildingsPerProject; b++) {
+      await seedBuilding(prisma, {
+        projectId: project.id,
+        name: `Block ${String.fromCharCode(65 + (b % 26))}${b >= 26 ? Math.floor(b / 26) : ""}`,
+        floorCount: dataset.floorsPerBuilding,
+        sortOrder: b,
+        random,
+      });
+    }
+    console.log(`  Project ${p}/${dataset.projects} seeded`);
+  }
+
+  const [buildings, floors, units] = await Promise.all([
+    prisma.building.count(),
+    prisma.floor.count(),
+    prisma.unit.count(),
+  ]);
+  console.log(
+    `✅ Loadtest seed completed in ${((Date.now() - started) / 1000).toFixed(1)}s: ` +
+      `${dataset.projects} projects, ${buildings} buildings, ${floors} floors, ${units} units`
+  );
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+  });
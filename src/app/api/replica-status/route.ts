@@ -0,0 +1,14 @@
+import { NextResponse } from "next/server";
+import { getReplicaStatus } from "@/lib/prisma";
+
+export const dynamic = "force-dynamic";
+
+// Report how far the read replica is behind the primary
+export async function GET() {
+  try {
+    return NextResponse.json(await getReplicaStatus());
+  } catch (error) {
+    console.error("Replica status error:", error);
+    return NextResponse.json({ error: "Failed to check replica" }, { status: 500 });
+  }
+}
@@ -0,0 +1,124 @@
+import { NextResponse } from "next/server";
+import { revalidateTag } from "next/cache";
+import prisma from "@/lib/prisma";
+
+interface UnitChange {
+  id: string;
+  updatedAt: string; // Version the client last saw — used for conflict detection
+  data: Record<string, unknown>;
+}
+
+class ConflictError extends Error {
+  // null when a concurrent write was only noticed mid-batch; the ids are looked up after rollback
+  constructor(public ids: string[] | null) {
+    super("Units were modified by someone else");
+  }
+}
+
+// Ids whose version differs from what the client saw, or that no longer exist
+function staleIds(changes: UnitChange[], current: { id: string; updatedAt: Date }[]) {
+  const versions = new Map(current.map((u) => [u.id, u.updatedAt.getTime()]));
+  return changes.filter((c) => versions.get(c.id) !== new Date(c.updatedAt).getTime()).map((c) => c.id);
+}
+
+const EDITABLE_FIELDS = [
+  "status",
+  "pricePerM2",
+  "totalPrice",
+  "customerName",
+  "customerPhone",
+  "customerNotes",
+] as const;
+
+// Upper bound per request; the client splits larger queues into several batches
+const MAX_BATCH_SIZE = 1000;
+
+// Apply a queue of unit edits in a single transaction.
+// Each change only applies if the unit's updatedAt still matches what the client saw;
+// if any unit was changed (or deleted) in the meantime the whole batch is rolled back with 409.
+export async function POST(req: Request) {
+  let changes: UnitChange[] = [];
+  try {
+    const body = await req.json();
+    changes = body.changes;
+
+    if (!changes || !Array.isArray(changes) || changes.length === 0) {
+      return NextResponse.json({ error: "No changes provided" }, { status: 400 });
+    }
+    if (changes.length > MAX_BATCH_SIZE) {
+      return NextResponse.json({ error: `At most ${MAX_BATCH_SIZE} changes per batch` }, { status: 400 });
+    }
+    if (changes.some((c) => !c.id || !c.updatedAt || !c.data)) {
+      return NextResponse.json({ error: "Each change needs id, updatedAt and data" }, { status: 400 });
+    }
+    if (new Set(changes.map((c) => c.id)).size !== changes.length) {
+      return NextResponse.json({ error: "Duplicate unit ids in batch" }, { status: 400 });
+    }
+
+    // Changes that set the same values are written together with one updateMany
+    const statusChangedAt = new Date();
+    const groups = new Map<string, { data: any; changes: UnitChange[] }>();
+    for (const change of changes) {
+      const data: any = {};
+      for (const field of EDITABLE_FIELDS) {
+        if (change.data[field] !== undefined) data[field] = change.data[field];
+      }
+      if (data.status !== undefined) data.statusChangedAt = statusChangedAt;
+
+      const key = JSON.stringify(data);
+      const group = groups.get(key);
+      if (group) group.changes.push(change);
+      else groups.set(key, { data, changes: [change] });
+    }
+
+    const ids = changes.map((c) => c.id);
+
+    await prisma.$transaction(
+      async (tx) => {
+        // Check every version up front so a stale batch fails before writing anything
+        const current = await tx.unit.findMany({ where: { id: { in: ids } }, select: { id: true, updatedAt: true } });
+        const conflicts = staleIds(changes, current);
+        if (conflicts.length > 0) throw new ConflictError(conflicts);
+
+        for (const { data, changes: group } of Array.from(groups.values())) {
+          // The version stays in the filter so a write that lands after the check is still caught
+          const result = await tx.unit.updateMany({
+            where: { OR: group.map((c) => ({ id: c.id, updatedAt: new Date(c.updatedAt) })) },
+            data,
+          });
+          if (result.count !== group.length) throw new ConflictError(null);
+        }
+      },
+      { timeout: 15000 }
+    );
+
+    const units = await prisma.unit.findMany({
+      where: { id: { in: ids } },
+      include: { floor: { include: { building: true } } },
+    });
+
+    revalidateTag("project");
+
+    return NextResponse.json({ success: true, units });
+  } catch (error) {
+    if (error instanceof ConflictError) {
+      let conflictIds = error.ids;
+      if (!conflictIds) {
+        const current = await prisma.unit.findMany({
+          where: { id: { in: changes.map((c) => c.id) } },
+          select: { id: true, updatedAt: true },
+        });
+        conflictIds = staleIds(changes, current);
+      }
+      // Send back the conflicting ids plus the current state of those that still exist;
+      // ids missing from `conflicts` were deleted
+      const units = await prisma.unit.findMany({
+        where: { id: { in: conflictIds } },
+        include: { floor: { include: { building: true } } },
+      });
+      return NextResponse.json({ error: error.message, ids: conflictIds, conflicts: units }, { status: 409 });
+    }
+    console.error("Batch update error:", error);
+    return NextResponse.json({ error: "Failed to update units" }, { status: 500 });
+  }
+}
@@ -1,6 +1,6 @@
 import Link from "next/link";
 import { getTranslations } from "next-intl/server";
-import prisma from "@/lib/prisma";
+import { sessionReadClient } from "@/lib/prisma";
 import { ArrowUpRight } from "lucide-react";
 
 export const dynamic = "force-dynamic";
@@ -31,16 +31,17 @@ function formatRelative(dateIso: string) {
 
 export default async function AdminDashboard() {
   const t = await getTranslations("admin");
+  const db = sessionReadClient();
 
   const [total, available, reserved, sold, leadsTotal, leadsNew, recentLeads] =
     await Promise.all([
-      prisma.unit.count(),
-      prisma.unit.count({ where: { status: "available" } }),
-      prisma.unit.count({ where: { status: "reserved" } }),
-      prisma.unit.count({ where: { status: "sold" } }),
-      prisma.lead.count(),
-      prisma.lead.count({ where: { status: "new" } }),
-      prisma.lead.findMany({
+      db.unit.count(),
+      db.unit.count({ where: { status: "available" } }),
+      db.unit.count({ where: { status: "reserved" } }),
+      db.unit.count({ where: { status: "sold" } }),
+      db.lead.count(),
+      db.lead.count({ where: { status: "new" } }),
+      db.lead.findMany({
         orderBy: { createdAt: "desc" },
         take: 6,
       }),
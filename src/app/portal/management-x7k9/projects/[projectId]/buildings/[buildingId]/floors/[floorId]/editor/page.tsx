@@ -7,6 +7,7 @@ import { useTranslations } from "next-intl";
 import PolygonEditor, { Point, Polygon } from "@/components/admin/PolygonEditor";
 import Image from "next/image";
 import { SHOW_AI } from "@/lib/flags";
+import { changedPolygons } from "@/lib/polygon-editor";
 
 interface Unit {
   id: string;
@@ -65,8 +66,50 @@ export default function FloorPlanEditorPage() {
     floorRef.current = floor;
   }, [floor]);
 
+  // Last saved points per polygon — autosave only sends polygons that differ from these
+  const savedPointsRef = useRef<Record<string, Point[]>>({});
+  const polygonsRef = useRef<Polygon[]>([]);
+  useEffect(() => {
+    polygonsRef.current = polygons;
+  }, [polygons]);
+  // Polygon PUTs in flight, by polygon id (their points already count as saved)
+  const savesInFlightRef = useRef(new Map<Promise<void>, string>());
+  // Set when a save fails so a retry is scheduled even if nothing else is edited
+  const [saveFailedAt, setSaveFailedAt] = useState(0);
+  // Bumped on every reload so the editor drops undo history for the old geometry
+  const [polygonRevision, setPolygonRevision] = useState(0);
+
+  const savePolygonChanges = useCallback(async () => {
+    const changed = changedPolygons(savedPointsRef.current, polygonsRef.current);
+    changed.forEach((p) => {
+      const previous = savedPointsRef.current[p.id];
+      savedPointsRef.current[p.id] = p.points;
+      const save = (async () => {
+        try {
+          const res = await fetch(`/api/units/${p.id}`, {
+            method: "PUT",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ polygonData: p.points }),
+          });
+          if (!res.ok) throw new Error();
+        } catch {
+          // Mark as unsaved again; the retry effect below picks it up
+          if (savedPointsRef.current[p.id] === p.points) savedPointsRef.current[p.id] = previous;
+          setSaveFailedAt(Date.now());
+        } finally {
+          savesInFlightRef.current.delete(save);
+        }
+      })();
+      savesInFlightRef.current.set(save, p.id);
+    });
+    // Also wait for saves started earlier, so callers see every edit settled
+    await Promise.all(Array.from(savesInFlightRef.current.keys()));
+  }, []);
+
   // Load floor data
   const loadFloor = useCallback(async () => {
+    // Don't let a reload overwrite geometry that hasn't been saved yet
+    await savePolygonChanges();
     const res = await fetch(`/api/floors/${params.floorId}`);
     const data = await res.json();
     setFloor({
@@ -84,13 +127,56 @@ export default function FloorPlanEditorPage() {
         color: getStatusColor(u.status),
         label: u.unitNumber,
       }));
-    setPolygons(polys);
-  }, [params.floorId, params.buildingId, params.projectId]);
+
+    // The response may predate local geometry: keep polygons that are unsaved (failed or edited
+    // since) or whose save started during the fetch, together with their saved state
+    const keep = new Set(
+      changedPolygons(savedPointsRef.current, polygonsRef.current)
+        .map((p) => p.id)
+        .concat(Array.from(savesInFlightRef.current.values()))
+    );
+    const local = new Map(polygonsRef.current.map((p) => [p.id, p.points]));
+    const previousSaved = savedPointsRef.current;
+    savedPointsRef.current = Object.fromEntries(
+      polys.map((p) => [p.id, keep.has(p.id) && local.has(p.id) ? previousSaved[p.id] : p.points])
+    );
+    setPolygons(polys.map((p) => (keep.has(p.id) && local.has(p.id) ? { ...p, points: local.get(p.id)! } : p)));
+    setPolygonRevision((r) => r + 1);
+  }, [params.floorId, params.buildingId, params.projectId, savePolygonChanges]);
 
   useEffect(() => {
     loadFloor();
   }, [loadFloor]);
 
+  // Autosave geometry shortly after the last edit, and once more when leaving the editor
+  useEffect(() => {
+    const timer = setTimeout(savePolygonChanges, 800);
+    return () => clearTimeout(timer);
+  }, [polygons, savePolygonChanges]);
+
+  useEffect(() => () => {
+    savePolygonChanges();
+  }, [savePolygonChanges]);
+
+  // Retry failed saves without waiting for another edit
+  useEffect(() => {
+    if (!saveFailedAt) return;
+    const timer = setTimeout(savePolygonChanges, 3000);
+    return () => clearTimeout(timer);
+  }, [saveFailedAt, savePolygonChanges]);
+
+  // Warn before closing the tab while geometry is unsaved or still being sent
+  useEffect(() => {
+    const warn = (e: BeforeUnloadEvent) => {
+      const dirty = changedPolygons(savedPointsRef.current, polygonsRef.current).length > 0;
+      if (!dirty && savesInFlightRef.current.size === 0) return;
+      e.preventDefault();
+      e.returnValue = "";
+    };
+    window.addEventListener("beforeunload", warn);
+    return () => window.removeEventListener("beforeunload", warn);
+  }, []);
+
   // Update form ONLY when selected unit changes (not on every floor reload)
   // This prevents the form from resetting after image upload
   useEffect(() => {
@@ -176,6 +262,7 @@ export default function FloorPlanEditorPage() {
         }),
       });
       const newUnit = await res.json();
+      savedPointsRef.current[newUnit.id] = points;
 
       // Add to local state
       setPolygons([
@@ -198,20 +285,12 @@ export default function FloorPlanEditorPage() {
     }
   };
 
-  // Handle polygon update
-  const handlePolygonUpdate = async (id: string, points: Point[]) => {
-    // Update local state immediately for smooth dragging
+  // Handle polygon update (the editor commits once per finished drag or undo/redo step)
+  const handlePolygonUpdate = useCallback((id: string, points: Point[]) => {
     setPolygons((prev) =>
       prev.map((p) => (p.id === id ? { ...p, points } : p))
     );
-
-    // Debounced save to server
-    await fetch(`/api/units/${id}`, {
-      method: "PUT",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify({ polygonData: points }),
-    });
-  };
+  }, []);
 
   // Handle polygon deletion
   const handlePolygonDelete = async (id: string) => {
@@ -509,6 +588,7 @@ export default function FloorPlanEditorPage() {
               onPolygonUpdate={handlePolygonUpdate}
               onPolygonSelect={setSelectedPolygonId}
               onPolygonDelete={handlePolygonDelete}
+              revision={polygonRevision}
             />
           </div>
         </div>
@@ -3,6 +3,7 @@
 import { useState, useMemo, useEffect, useRef } from "react";
 import { useTranslations } from "next-intl";
 import { formatPrice } from "@/lib/utils";
+import { useVirtualRows } from "@/hooks/useVirtualRows";
 
 interface Unit {
   id: string;
@@ -15,6 +16,7 @@ interface Unit {
   customerName: string | null;
   customerPhone: string | null;
   customerNotes: string | null;
+  updatedAt: string;
   floor: {
     id: string;
     number: number;
@@ -34,7 +36,17 @@ interface Props {
   projectId: string;
 }
 
-export default function UnitsClient({ initialUnits, initialBuildings, projectId }: Props) {
+type Row =
+  | { type: "floor"; floor: number; units: Unit[] }
+  | { type: "unit"; unit: Unit; index: number };
+
+// Every row (floor header or unit) has the same height so the grid can be windowed
+const ROW_HEIGHT = 52;
+
+// Matches the batch size limit of /api/units/batch
+const SAVE_BATCH_SIZE = 1000;
+
+export default function UnitsClient({ initialUnits, initialBuildings }: Props) {
   const t = useTranslations("admin");
   const tc = useTranslations("common");
   const [units, setUnits] = useState<Unit[]>(initialUnits);
@@ -43,58 +55,113 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
   const [filterStatus, setFilterStatus] = useState("");
   const [filterRooms, setFilterRooms] = useState("");
   const [reservationModal, setReservationModal] = useState<Unit | null>(null);
-  const [selectedUnits, setSelectedUnits] = useState<string[]>([]);
+  const [selectedUnits, setSelectedUnits] = useState<Set<string>>(new Set());
   const [bulkPricing, setBulkPricing] = useState("");
   const [bulkStatus, setBulkStatus] = useState("");
-  const [isBulkLoading, setIsBulkLoading] = useState(false);
-  const isMounted = useRef(false);
-
-  const loadUnits = (status: string, rooms: string) => {
-    const qs = new URLSearchParams();
-    qs.set("projectId", projectId);
-    if (status) qs.set("status", status);
-    if (rooms) qs.set("rooms", rooms);
-    fetch(`/api/units?${qs}`)
-      .then((r) => r.json())
-      .then(setUnits);
-  };
+  // Local edits waiting to be flushed in one batch, keyed by unit id
+  const [pending, setPending] = useState<Record<string, Partial<Unit>>>({});
+  const [isSaving, setIsSaving] = useState(false);
+  const [conflictCount, setConflictCount] = useState(0);
+  const [cursor, setCursor] = useState(0);
+  const anchor = useRef(0);
+
+  const pendingCount = Object.keys(pending).length;
 
   useEffect(() => {
-    if (!isMounted.current) { isMounted.current = true; return; }
-    loadUnits(filterStatus, filterRooms);
-  // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [filterStatus, filterRooms]);
-
-  const updateUnit = async (unitId: string, data: Record<string, unknown>) => {
-    const previous = units.find((u) => u.id === unitId);
-    setUnits((prev) => prev.map((u) => (u.id === unitId ? { ...u, ...data } : u)));
-    const res = await fetch(`/api/units/${unitId}`, {
-      method: "PUT",
-      headers: { "Content-Type": "application/json" },
-      body: JSON.stringify(data),
+    if (pendingCount === 0) return;
+    const warn = (e: BeforeUnloadEvent) => { e.preventDefault(); e.returnValue = ""; };
+    window.addEventListener("beforeunload", warn);
+    return () => window.removeEventListener("beforeunload", warn);
+  }, [pendingCount]);
+
+  const queueChange = (unitIds: string[], data: Partial<Unit>) => {
+    setPending((prev) => {
+      const next = { ...prev };
+      unitIds.forEach((id) => { next[id] = { ...next[id], ...data }; });
+      return next;
     });
-    if (!res.ok && previous) {
-      setUnits((prev) => prev.map((u) => (u.id === unitId ? previous : u)));
-    }
+  };
+
+  const mergeServerUnits = (fresh: Unit[]) => {
+    const byId = new Map(fresh.map((u) => [u.id, u]));
+    setUnits((prev) => prev.map((u) => byId.get(u.id) ?? u));
+  };
+
+  const saveChanges = async () => {
+    const sent = pending;
+    const ids = Object.keys(sent);
+    if (ids.length === 0) return;
+    const unitById = new Map(units.map((u) => [u.id, u]));
+    setIsSaving(true);
+    setConflictCount(0);
+    try {
+      // The API takes at most SAVE_BATCH_SIZE changes; each batch is saved atomically
+      for (let i = 0; i < ids.length; i += SAVE_BATCH_SIZE) {
+        const batch = ids.slice(i, i + SAVE_BATCH_SIZE);
+        const res = await fetch("/api/units/batch", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            changes: batch.map((id) => ({ id, updatedAt: unitById.get(id)?.updatedAt, data: sent[id] })),
+          }),
+        });
+        const body = await res.json();
+        if (res.ok) {
+          mergeServerUnits(body.units);
+          // Keep anything edited again while the request was in flight
+          setPending((prev) => {
+            const next = { ...prev };
+            batch.forEach((id) => { if (next[id] === sent[id]) delete next[id]; });
+            return next;
+          });
+        } else if (res.status === 409) {
+          // Nothing in this batch was written; drop the stale edits and keep the rest queued
+          const stale = new Set<string>(body.ids);
+          const existing = new Set(body.conflicts.map((u: Unit) => u.id));
+          mergeServerUnits(body.conflicts);
+          // Units that are gone from the server are removed from the grid
+          setUnits((prev) => prev.filter((u) => !stale.has(u.id) || existing.has(u.id)));
+          setPending((prev) => Object.fromEntries(Object.entries(prev).filter(([id]) => !stale.has(id))));
+          setConflictCount(stale.size);
+          return;
+        } else {
+          alert(t("saveFailed"));
+          return;
+        }
+      }
+    } catch {
+      alert(t("saveFailed"));
+    } finally { setIsSaving(false); }
   };
 
   const handleStatusChange = (unit: Unit, newStatus: string) => {
     if (newStatus === "reserved" || newStatus === "sold") {
       setReservationModal({ ...unit, status: newStatus });
     } else {
-      updateUnit(unit.id, { status: newStatus, customerName: null, customerPhone: null, customerNotes: null });
+      queueChange([unit.id], { status: newStatus, customerName: null, customerPhone: null, customerNotes: null });
     }
   };
 
+  // Server values with queued edits applied on top
+  const displayUnits = useMemo(
+    () => units.map((u) => (pending[u.id] ? { ...u, ...pending[u.id] } : u)),
+    [units, pending]
+  );
+
   const roomOptions = useMemo(() => {
     const rooms = new Set(units.map((u) => u.rooms));
     return Array.from(rooms).sort((a, b) => a - b);
   }, [units]);
 
+  // All units are already loaded, so filtering happens locally
   const buildingUnits = useMemo(() => {
     if (!selectedBuildingId) return [];
-    return units.filter((u) => u.floor.building.id === selectedBuildingId);
-  }, [units, selectedBuildingId]);
+    return displayUnits.filter((u) =>
+      u.floor.building.id === selectedBuildingId &&
+      (!filterStatus || u.status === filterStatus) &&
+      (!filterRooms || u.rooms === parseInt(filterRooms))
+    );
+  }, [displayUnits, selectedBuildingId, filterStatus, filterRooms]);
 
   const groupedByFloor = useMemo(() => {
     const groups: Record<number, Unit[]> = {};
@@ -108,14 +175,106 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
       .map(([floor, units]) => ({ floor: parseInt(floor), units }));
   }, [buildingUnits]);
 
-  const getBuildingStats = (buildingId: string) => {
-    const bUnits = units.filter((u) => u.floor.building.id === buildingId);
-    return {
-      total: bUnits.length,
-      available: bUnits.filter((u) => u.status === "available").length,
-      reserved: bUnits.filter((u) => u.status === "reserved").length,
-      sold: bUnits.filter((u) => u.status === "sold").length,
-    };
+  // Flatten floors into rows; unitRows[i] is the row of the i-th unit in keyboard order
+  const { rows, unitRows, floorStarts } = useMemo(() => {
+    const rows: Row[] = [];
+    const unitRows: number[] = [];
+    const floorStarts: number[] = [];
+    groupedByFloor.forEach(({ floor, units }) => {
+      rows.push({ type: "floor", floor, units });
+      floorStarts.push(unitRows.length);
+      units.forEach((unit) => {
+        unitRows.push(rows.length);
+        rows.push({ type: "unit", unit, index: unitRows.length - 1 });
+      });
+    });
+    return { rows, unitRows, floorStarts };
+  }, [groupedByFloor]);
+
+  const { containerRef, onScroll, start, end, totalHeight, offsetTop, scrollToIndex } = useVirtualRows(rows.length, ROW_HEIGHT);
+
+  const buildingStats = useMemo(() => {
+    const stats: Record<string, { total: number; available: number; reserved: number; sold: number }> = {};
+    displayUnits.forEach((u) => {
+      const buildingId = u.floor.building.id;
+      if (!stats[buildingId]) stats[buildingId] = { total: 0, available: 0, reserved: 0, sold: 0 };
+      const s = stats[buildingId];
+      s.total++;
+      if (u.status === "available") s.available++;
+      else if (u.status === "reserved") s.reserved++;
+      else if (u.status === "sold") s.sold++;
+    });
+    return stats;
+  }, [displayUnits]);
+
+  const unitAt = (i: number) => (rows[unitRows[i]] as Extract<Row, { type: "unit" }>).unit;
+  const activeIndex = Math.min(cursor, unitRows.length - 1);
+
+  // A new building or filter means a different list; start range selection from its top
+  useEffect(() => {
+    anchor.current = 0;
+  }, [selectedBuildingId, filterStatus, filterRooms]);
+
+  const selectRange = (from: number, to: number) => {
+    const last = unitRows.length - 1;
+    const clamp = (i: number) => Math.max(0, Math.min(last, i));
+    const [a, b] = from < to ? [clamp(from), clamp(to)] : [clamp(to), clamp(from)];
+    setSelectedUnits((prev) => {
+      const next = new Set(prev);
+      for (let i = a; i <= b; i++) next.add(unitAt(i).id);
+      return next;
+    });
+  };
+
+  const toggleUnit = (id: string) => {
+    setSelectedUnits((prev) => {
+      const next = new Set(prev);
+      if (next.has(id)) next.delete(id);
+      else next.add(id);
+      return next;
+    });
+  };
+
+  const moveCursor = (to: number, extend: boolean) => {
+    if (unitRows.length === 0) return;
+    const next = Math.max(0, Math.min(unitRows.length - 1, to));
+    setCursor(next);
+    scrollToIndex(unitRows[next]);
+    if (extend) selectRange(anchor.current, next);
+    else anchor.current = next;
+  };
+
+  const handleUnitClick = (index: number, shiftKey: boolean) => {
+    setCursor(index);
+    if (shiftKey) selectRange(anchor.current, index);
+    else { toggleUnit(unitAt(index).id); anchor.current = index; }
+  };
+
+  const handleKeyDown = (e: React.KeyboardEvent) => {
+    const tag = (e.target as HTMLElement).tagName;
+    if (tag === "SELECT" || unitRows.length === 0) return;
+    switch (e.key) {
+      case "ArrowDown":
+        e.preventDefault(); moveCursor(activeIndex + 1, e.shiftKey); break;
+      case "ArrowUp":
+        e.preventDefault(); moveCursor(activeIndex - 1, e.shiftKey); break;
+      case "PageDown":
+        e.preventDefault(); moveCursor(floorStarts.find((s) => s > activeIndex) ?? unitRows.length - 1, e.shiftKey); break;
+      case "PageUp":
+        e.preventDefault(); moveCursor(floorStarts.filter((s) => s < activeIndex).pop() ?? 0, e.shiftKey); break;
+      case "Home":
+        e.preventDefault(); moveCursor(0, e.shiftKey); break;
+      case "End":
+        e.preventDefault(); moveCursor(unitRows.length - 1, e.shiftKey); break;
+      case " ":
+        if (tag === "INPUT") return;
+        e.preventDefault(); toggleUnit(unitAt(activeIndex).id); anchor.current = activeIndex; break;
+      case "a":
+        if (!e.ctrlKey && !e.metaKey) return;
+        e.preventDefault(); setSelectedUnits(new Set(buildingUnits.map((u) => u.id))); break;
+      case "Escape":
+        setSelectedUnits(new Set()); break;
+    }
   };
 
   return (
@@ -124,10 +283,10 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
 
       <div className="grid grid-cols-2 md:grid-cols-4 gap-3 mb-6">
         {buildings.map((building) => {
-          const stats = getBuildingStats(building.id);
+          const stats = buildingStats[building.id] || { available: 0, reserved: 0, sold: 0 };
           const isSelected = selectedBuildingId === building.id;
           return (
-            <button key={building.id} onClick={() => setSelectedBuildingId(building.id)}
+            <button key={building.id} onClick={() => { setSelectedBuildingId(building.id); setCursor(0); }}
               className={`p-4 rounded-xl border-2 text-left transition ${isSelected ? "border-emerald-500 bg-emerald-50" : "border-slate-200 hover:border-emerald-300 bg-white"}`}>
               <h3 className="font-semibold text-lg">{building.name}</h3>
               <div className="flex gap-3 mt-2 text-xs">
@@ -154,80 +313,103 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
           {roomOptions.map((r) => <option key={r} value={r}>{r}</option>)}
         </select>
         <span className="text-sm text-slate-500 ml-2">{buildingUnits.length} {t("units")}</span>
+        {pendingCount > 0 && (
+          <div className="ml-auto flex items-center gap-3">
+            <span className="text-sm font-medium text-indigo-700">{t("unsavedChanges", { count: pendingCount })}</span>
+            <button onClick={() => setPending({})} disabled={isSaving}
+              className="px-3 py-2 text-sm font-medium text-slate-600 bg-slate-100 rounded-lg hover:bg-slate-200 disabled:opacity-50 transition">
+              {t("discardChanges")}
+            </button>
+            <button onClick={saveChanges} disabled={isSaving}
+              className="px-4 py-2 text-sm font-semibold text-white bg-indigo-600 rounded-lg hover:bg-indigo-700 disabled:opacity-50 transition">
+              {isSaving ? t("saving") : t("saveChanges")}
+            </button>
+          </div>
+        )}
       </div>
 
-      {groupedByFloor.length === 0 ? (
+      {conflictCount > 0 && (
+        <div className="mb-4 px-4 py-3 rounded-lg border border-yellow-300 bg-yellow-50 text-sm text-yellow-800 flex items-start justify-between gap-3">
+          <span>{t("conflictWarning", { count: conflictCount })}</span>
+          <button onClick={() => setConflictCount(0)} className="text-yellow-700 hover:text-yellow-900">✕</button>
+        </div>
+      )}
+
+      {rows.length === 0 ? (
         <div className="bg-slate-50 rounded-xl p-8 text-center text-slate-500">{t("noUnitsYet")}</div>
       ) : (
-        <div className="space-y-4">
-          {groupedByFloor.map(({ floor, units: floorUnits }) => (
-            <div key={floor} className="bg-white rounded-xl shadow-sm border overflow-hidden">
-              <div className="bg-slate-50 px-4 py-3 border-b flex items-center justify-between">
-                <div className="flex items-center gap-3">
-                  <input type="checkbox" className="w-4 h-4 rounded border-slate-300 text-indigo-600 focus:ring-indigo-500 cursor-pointer"
-                    checked={floorUnits.length > 0 && floorUnits.every(u => selectedUnits.includes(u.id))}
-                    onChange={(e) => {
-                      if (e.target.checked) setSelectedUnits(prev => Array.from(new Set([...prev, ...floorUnits.map(u => u.id)])));
-                      else setSelectedUnits(prev => prev.filter(id => !floorUnits.find(u => u.id === id)));
-                    }} />
-                  <h3 className="font-semibold text-slate-700">{t("floor")} {floor}</h3>
-                </div>
-                <span className="text-xs text-slate-500">{floorUnits.length} {t("units")}</span>
-              </div>
-              <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-3 p-4">
-                {floorUnits.map((unit) => {
-                  const pricePerM2 = unit.pricePerM2 || unit.floor.basePricePerM2 || 0;
-                  const totalPrice = unit.totalPrice || pricePerM2 * unit.area;
-                  return (
-                    <div key={unit.id} className={`p-3 rounded-lg border ${
-                      unit.status === "available" ? "border-emerald-200 bg-emerald-50"
-                      : unit.status === "reserved" ? "border-yellow-200 bg-yellow-50"
-                      : "border-red-200 bg-red-50"}`}>
-                      <div className="flex items-center justify-between mb-2">
-                        <div className="flex items-center gap-2">
-                          <input type="checkbox" className="w-4 h-4 rounded border-slate-300 text-indigo-600 focus:ring-indigo-500 cursor-pointer"
-                            checked={selectedUnits.includes(unit.id)}
-                            onChange={(e) => {
-                              if (e.target.checked) setSelectedUnits(prev => [...prev, unit.id]);
-                              else setSelectedUnits(prev => prev.filter(id => id !== unit.id));
+        <>
+          <div ref={containerRef} onScroll={onScroll} onKeyDown={handleKeyDown} tabIndex={0}
+            className="bg-white rounded-xl shadow-sm border overflow-auto h-[calc(100vh-360px)] min-h-[400px] outline-none focus:ring-2 focus:ring-indigo-500">
+            <div style={{ height: totalHeight, position: "relative" }}>
+              <div style={{ transform: `translateY(${offsetTop}px)` }}>
+                {rows.slice(start, end).map((row) => {
+                  if (row.type === "floor") {
+                    const allSelected = row.units.every((u) => selectedUnits.has(u.id));
+                    return (
+                      <div key={`floor-${row.floor}`} style={{ height: ROW_HEIGHT }}
+                        className="bg-slate-50 px-4 border-b flex items-center justify-between">
+                        <div className="flex items-center gap-3">
+                          <input type="checkbox" tabIndex={-1} className="w-4 h-4 rounded border-slate-300 text-indigo-600 focus:ring-indigo-500 cursor-pointer"
+                            checked={allSelected}
+                            onChange={() => {
+                              setSelectedUnits((prev) => {
+                                const next = new Set(prev);
+                                row.units.forEach((u) => (allSelected ? next.delete(u.id) : next.add(u.id)));
+                                return next;
+                              });
                             }} />
-                          <span className="font-bold">№{unit.unitNumber}</span>
+                          <h3 className="font-semibold text-slate-700">{t("floor")} {row.floor}</h3>
                         </div>
-                        <select value={unit.status} onChange={(e) => handleStatusChange(unit, e.target.value)}
-                          className={`text-xs font-medium px-2 py-1 rounded-full border-0 cursor-pointer ${
-                            unit.status === "available" ? "bg-emerald-200 text-emerald-800"
-                            : unit.status === "reserved" ? "bg-yellow-200 text-yellow-800"
-                            : "bg-red-200 text-red-800"}`}>
-                          <option value="available">{t("available")}</option>
-                          <option value="reserved">{t("reserved")}</option>
-                          <option value="sold">{t("sold")}</option>
-                        </select>
-                      </div>
-                      <div className="text-sm text-slate-600 space-y-1">
-                        <p>{unit.rooms} {t("rooms")} · {unit.area} m²</p>
-                        <p className="font-medium text-slate-800">{formatPrice(totalPrice)}</p>
+                        <span className="text-xs text-slate-500">{row.units.length} {t("units")}</span>
                       </div>
-                      {(unit.status === "reserved" || unit.status === "sold") && unit.customerName && (
-                        <div className="mt-2 pt-2 border-t border-slate-200 text-xs">
-                          <p className="font-medium">{unit.customerName}</p>
-                          {unit.customerPhone && <p className="text-slate-500">{unit.customerPhone}</p>}
-                          {unit.customerNotes && <p className="text-slate-400 truncate">{unit.customerNotes}</p>}
-                        </div>
-                      )}
+                    );
+                  }
+
+                  const { unit, index } = row;
+                  const pricePerM2 = unit.pricePerM2 || unit.floor.basePricePerM2 || 0;
+                  const totalPrice = unit.totalPrice || pricePerM2 * unit.area;
+                  return (
+                    <div key={unit.id} style={{ height: ROW_HEIGHT }}
+                      className={`flex items-center gap-4 px-4 border-b border-l-4 text-sm ${
+                        unit.status === "available" ? "border-l-emerald-400"
+                        : unit.status === "reserved" ? "border-l-yellow-400"
+                        : "border-l-red-400"} ${index === activeIndex ? "bg-indigo-50" : selectedUnits.has(unit.id) ? "bg-slate-50" : ""}`}>
+                      <input type="checkbox" tabIndex={-1} className="w-4 h-4 rounded border-slate-300 text-indigo-600 focus:ring-indigo-500 cursor-pointer"
+                        checked={selectedUnits.has(unit.id)} readOnly
+                        onClick={(e) => handleUnitClick(index, e.shiftKey)} />
+                      <span className="font-bold w-16">№{unit.unitNumber}</span>
+                      <span className="w-32 text-slate-600">{unit.rooms} {t("rooms")} · {unit.area} m²</span>
+                      <span className="w-24 font-medium text-slate-800">{formatPrice(totalPrice)}</span>
+                      <select value={unit.status} onChange={(e) => handleStatusChange(unit, e.target.value)}
+                        className={`text-xs font-medium px-2 py-1 rounded-full border-0 cursor-pointer ${
+                          unit.status === "available" ? "bg-emerald-200 text-emerald-800"
+                          : unit.status === "reserved" ? "bg-yellow-200 text-yellow-800"
+                          : "bg-red-200 text-red-800"}`}>
+                        <option value="available">{t("available")}</option>
+                        <option value="reserved">{t("reserved")}</option>
+                        <option value="sold">{t("sold")}</option>
+                      </select>
+                      <span className="flex-1 min-w-0 truncate text-xs text-slate-500">
+                        {(unit.status === "reserved" || unit.status === "sold") && unit.customerName &&
+                          [unit.customerName, unit.customerPhone, unit.customerNotes].filter(Boolean).join(" · ")}
+                      </span>
+                      {pending[unit.id] && <span className="w-2 h-2 rounded-full bg-indigo-500 shrink-0" />}
                     </div>
                   );
                 })}
               </div>
             </div>
-          ))}
-        </div>
+          </div>
+          <p className="mt-2 text-xs text-slate-400">{t("keyboardHint")}</p>
+        </>
       )}
 
       {reservationModal && (
         <ReservationModal
           unit={reservationModal}
           onClose={() => setReservationModal(null)}
-          onSave={async (data) => { await updateUnit(reservationModal.id, data); setReservationModal(null); }}
+          onSave={async (data) => { queueChange([reservationModal.id], data as Partial<Unit>); setReservationModal(null); }}
           translations={{
             reserve: t("reserve"), sell: t("sell"),
             customerName: t("customerName"), customerPhone: t("customerPhone"), customerNotes: t("customerNotes"),
@@ -237,12 +419,12 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
         />
       )}
 
-      {selectedUnits.length > 0 && (
+      {selectedUnits.size > 0 && (
         <div className="fixed bottom-0 left-0 right-0 bg-white/95 backdrop-blur-md border-t border-slate-200 shadow-[0_-10px_40px_rgba(0,0,0,0.1)] p-4 z-[100] animate-in slide-in-from-bottom flex justify-end">
           <div className="max-w-7xl mx-auto w-full flex flex-col sm:flex-row items-center justify-between gap-4">
             <div className="flex items-center gap-4">
-              <span className="bg-indigo-100 text-indigo-700 font-bold px-4 py-2 rounded-xl">{selectedUnits.length} ta xonadon tanlandi</span>
-              <button onClick={() => setSelectedUnits([])} className="text-sm font-semibold text-slate-500 hover:text-slate-700 transition">Bekor qilish</button>
+              <span className="bg-indigo-100 text-indigo-700 font-bold px-4 py-2 rounded-xl">{selectedUnits.size} ta xonadon tanlandi</span>
+              <button onClick={() => setSelectedUnits(new Set())} className="text-sm font-semibold text-slate-500 hover:text-slate-700 transition">Bekor qilish</button>
             </div>
             <div className="flex flex-wrap items-center gap-3 w-full sm:w-auto">
               <select value={bulkStatus} onChange={(e) => setBulkStatus(e.target.value)}
@@ -256,36 +438,17 @@ export default function UnitsClient({ initialUnits, initialBuildings, projectId
                 onChange={(e) => setBulkPricing(e.target.value)}
                 className="px-4 py-2.5 w-48 bg-slate-50 border border-slate-200 rounded-xl outline-none focus:ring-2 focus:ring-indigo-500 text-sm font-medium" />
               <button
-                onClick={async () => {
+                onClick={() => {
                   if (!bulkStatus && !bulkPricing) return alert("Narx yoki statusni kiriting");
-                  setIsBulkLoading(true);
-                  const data: Record<string, unknown> = {};
+                  const data: Partial<Unit> = {};
                   if (bulkStatus) data.status = bulkStatus;
                   if (bulkPricing) data.pricePerM2 = parseInt(bulkPricing);
-                  const previousUnits = units.filter((u) => selectedUnits.includes(u.id));
-                  setUnits((prev) => prev.map((u) => selectedUnits.includes(u.id) ? { ...u, ...data } : u));
-                  setSelectedUnits([]); setBulkStatus(""); setBulkPricing("");
-                  try {
-                    const res = await fetch("/api/units", {
-                      method: "PATCH",
-                      headers: { "Content-Type": "application/json" },
-                      body: JSON.stringify({ unitIds: previousUnits.map((u) => u.id), data }),
-                    });
-                    if (!res.ok) {
-                      previousUnits.forEach((prev) => {
-                        setUnits((units) => units.map((u) => (u.id === prev.id ? prev : u)));
-                      });
-                    }
-                  } catch {
-                    previousUnits.forEach((prev) => {
-                      setUnits((units) => units.map((u) => (u.id === prev.id ? prev : u)));
-                    });
-                    alert("Xatolik yuz berdi");
-                  } finally { setIsBulkLoading(false); }
+                  queueChange(Array.from(selectedUnits), data);
+                  setSelectedUnits(new Set()); setBulkStatus(""); setBulkPricing("");
                 }}
-                disabled={isBulkLoading || (!bulkStatus && !bulkPricing)}
+                disabled={!bulkStatus && !bulkPricing}
                 className="bg-indigo-600 text-white px-6 py-2.5 rounded-xl font-bold hover:bg-indigo-700 hover:shadow-lg disabled:opacity-50 transition-all cursor-pointer">
-                {isBulkLoading ? "Saqlanmoqda..." : "Ommaviy Saqlash"}
+                Qo&apos;llash
               </button>
             </div>
           </div>
@@ -31,6 +31,7 @@ export default async function AdminUnits({ params }: { params: { projectId: stri
       customerName: true,
       customerPhone: true,
       customerNotes: true,
+      updatedAt: true,
       floor: {
         select: {
           id: true,
@@ -49,7 +50,7 @@ export default async function AdminUnits({ params }: { params: { projectId: stri
 
   return (
     <UnitsClient
-      initialUnits={units}
+      initialUnits={units.map((u) => ({ ...u, updatedAt: u.updatedAt.toISOString() }))}
       initialBuildings={project.buildings}
       projectId={params.projectId}
     />
@@ -1,5 +1,5 @@
 import { Suspense } from "react";
-import prisma from "@/lib/prisma";
+import { sessionReadClient } from "@/lib/prisma";
 import { notFound } from "next/navigation";
 import Navbar from "@/components/Navbar";
 import Footer from "@/components/Footer";
@@ -8,7 +8,7 @@ import ExploreClient from "@/components/ExploreClient";
 export const dynamic = "force-dynamic";
 
 export default async function ExplorePage({ params }: { params: { projectId: string } }) {
-  const project = await prisma.project.findUnique({
+  const project = await sessionReadClient().project.findUnique({
     where: { id: params.projectId },
     include: {
       buildings: {
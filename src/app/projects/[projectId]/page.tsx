@@ -1,7 +1,7 @@
 import Link from "next/link";
 import { notFound } from "next/navigation";
 import { cookies } from "next/headers";
-import prisma from "@/lib/prisma";
+import { sessionReadClient } from "@/lib/prisma";
 import Navbar from "@/components/Navbar";
 import Footer from "@/components/Footer";
 import LocationInfrastructure from "@/components/LocationInfrastructure";
@@ -16,7 +16,7 @@ export default async function ProjectPage({ params }: { params: { projectId: str
   const cookieStore = cookies();
   const locale = (cookieStore.get("locale")?.value || "en") as Locale;
 
-  const project = await prisma.project.findUnique({
+  const project = await sessionReadClient().project.findUnique({
     where: { id: params.projectId },
     include: {
       buildings: {
@@ -1,7 +1,8 @@
 "use client";
 
-import { useState, useRef, useEffect, useCallback } from "react";
+import { useState, useRef, useEffect, useCallback, useMemo, memo } from "react";
 import Image from "next/image";
+import { createFrameScheduler, SnapIndex, SnapTarget, EditHistory, samePoints } from "@/lib/polygon-editor";
 
 export interface Point {
   x: number; // Percentage 0-100
@@ -24,8 +25,92 @@ interface Props {
   onPolygonUpdate: (id: string, points: Point[]) => void;
   onPolygonSelect: (id: string | null) => void;
   onPolygonDelete: (id: string) => void;
+  // Bumped whenever `polygons` is replaced from the server; clears undo history
+  revision?: number;
 }
 
+// Snap distance in percent of the image (hold Alt to place points freely)
+const SNAP_RADIUS = 1.2;
+
+// Build SVG path directly from percentage points (viewBox is 0 0 100 100)
+const getPathString = (points: Point[]) => {
+  if (points.length < 2) return "";
+  return points
+    .map((p, i) => `${i === 0 ? "M" : "L"} ${p.x} ${p.y}`)
+    .join(" ") + " Z";
+};
+
+// Get color for polygon based on status
+const getPolygonColor = (polygon: Polygon, isSelected: boolean) => {
+  if (isSelected) return "rgba(59, 130, 246, 0.5)"; // Blue when selected
+  if (polygon.color) return polygon.color;
+  return "rgba(34, 197, 94, 0.4)"; // Default green
+};
+
+// Memoized so that only the polygon being edited re-renders while dragging
+const PolygonShape = memo(function PolygonShape({
+  polygon,
+  points,
+  isSelected,
+  onVertexMouseDown,
+}: {
+  polygon: Polygon;
+  points: Point[];
+  isSelected: boolean;
+  onVertexMouseDown: (e: React.MouseEvent, polygonId: string, vertexIndex: number) => void;
+}) {
+  const cx = points.reduce((s, p) => s + p.x, 0) / points.length;
+  const cy = points.reduce((s, p) => s + p.y, 0) / points.length;
+  return (
+    <g>
+      <path
+        d={getPathString(points)}
+        fill={getPolygonColor(polygon, isSelected)}
+        stroke={isSelected ? "#2563eb" : "#16a34a"}
+        strokeWidth={isSelected ? 0.6 : 0.4}
+        vectorEffect="non-scaling-stroke"
+        style={{ pointerEvents: "all", cursor: "pointer" }}
+        data-polygon-id={polygon.id}
+      />
+
+      {/* Vertices — shown when selected */}
+      {isSelected &&
+        points.map((point, i) => (
+          <circle
+            key={i}
+            cx={point.x}
+            cy={point.y}
+            r={1.2}
+            fill="white"
+            stroke="#2563eb"
+            strokeWidth={0.4}
+            vectorEffect="non-scaling-stroke"
+            style={{ pointerEvents: "all", cursor: "move" }}
+            data-polygon-id={polygon.id}
+            onMouseDown={(e) => onVertexMouseDown(e, polygon.id, i)}
+          />
+        ))}
+
+      {/* Label — show unit number */}
+      {points.length > 0 && (
+        <text
+          x={cx}
+          y={cy}
+          textAnchor="middle"
+          dominantBaseline="middle"
+          fontSize="3"
+          fontWeight="bold"
+          fill="#1e293b"
+          vectorEffect="non-scaling-stroke"
+          style={{ pointerEvents: "none" }}
+        >
+          {polygon.label || ""}
+        </text>
+      )}
+    </g>
+  );
+});
+
 export default function PolygonEditor({
   imageUrl,
   polygons,
@@ -34,11 +119,60 @@ export default function PolygonEditor({
   onPolygonUpdate,
   onPolygonSelect,
   onPolygonDelete,
+  revision,
 }: Props) {
   const containerRef = useRef<HTMLDivElement>(null);
   const [isDrawing, setIsDrawing] = useState(false);
   const [currentPoints, setCurrentPoints] = useState<Point[]>([]);
-  const [draggedVertex, setDraggedVertex] = useState<{ polygonId: string; vertexIndex: number } | null>(null);
+  // Cursor position (snapped) for the drawing preview line
+  const [hoverPoint, setHoverPoint] = useState<Point | null>(null);
+  const [snapTarget, setSnapTarget] = useState<SnapTarget | null>(null);
+  // Points of the polygon whose vertex is being dragged; committed to the parent on mouse up
+  const [dragPoints, setDragPoints] = useState<Point[] | null>(null);
+  const dragRef = useRef<{ polygonId: string; vertexIndex: number; before: Point[]; points: Point[] } | null>(null);
+  const historyRef = useRef(new EditHistory());
+
+  // Entries recorded against the previous geometry must not be replayed over freshly loaded polygons
+  useEffect(() => {
+    historyRef.current.clear();
+  }, [revision]);
+
+  // Rebuilt only when committed polygons change, not on every pointer move
+  const snapIndex = useMemo(() => new SnapIndex(polygons), [polygons]);
+  const snapIndexRef = useRef(snapIndex);
+  snapIndexRef.current = snapIndex;
+
+  const snapPoint = useCallback((raw: Point, free: boolean) => {
+    if (free) return { point: raw, target: null };
+    const drag = dragRef.current;
+    const target = snapIndexRef.current.snap(
+      raw,
+      SNAP_RADIUS,
+      drag ? { id: drag.polygonId, vertex: drag.vertexIndex } : undefined
+    );
+    return { point: target ? target.point : raw, target };
+  }, []);
+
+  // Pointer moves are coalesced so state updates at most once per animation frame
+  const pointerScheduler = useMemo(
+    () =>
+      createFrameScheduler<{ raw: Point; free: boolean }>(({ raw, free }) => {
+        const { point, target } = snapPoint(raw, free);
+        setSnapTarget(target);
+        const drag = dragRef.current;
+        if (drag) {
+          const next = [...drag.points];
+          next[drag.vertexIndex] = point;
+          drag.points = next;
+          setDragPoints(next);
+        } else {
+          setHoverPoint(point);
+        }
+      }),
+    [snapPoint]
+  );
+
+  useEffect(() => () => pointerScheduler.cancel(), [pointerScheduler]);
 
   // Convert pixel coordinates to percentage (0-100) using live bounding rect
   const toPercent = useCallback((px: number, total: number) => (px / total) * 100, []);
@@ -55,9 +189,16 @@ export default function PolygonEditor({
     [toPercent]
   );
 
+  const stopDrawing = () => {
+    setCurrentPoints([]);
+    setIsDrawing(false);
+    setHoverPoint(null);
+    setSnapTarget(null);
+  };
+
   // Handle click on canvas
   const handleCanvasClick = (e: React.MouseEvent) => {
-    if (draggedVertex) return; // Don't create points while dragging
+    if (dragRef.current) return; // Don't create points while dragging
 
     const target = e.target as HTMLElement;
     // If clicking on a polygon, select it
@@ -66,14 +207,15 @@ export default function PolygonEditor({
       return;
     }
 
+    const newPoint = snapPoint(getMousePercent(e), e.altKey).point;
+
     // If not in drawing mode and clicking on empty space, start drawing
-    if (!isDrawing) {
+    if (!isDrawing || currentPoints.length === 0) {
       setIsDrawing(true);
-      setCurrentPoints([getMousePercent(e)]);
+      setCurrentPoints([newPoint]);
       onPolygonSelect(null);
     } else {
       // Add point to current polygon
-      const newPoint = getMousePercent(e);
       const firstPoint = currentPoints[0];
 
       // If clicking near the first point, close the polygon
@@ -84,8 +226,7 @@ export default function PolygonEditor({
       if (currentPoints.length >= 3 && distance < 3) {
         // Close polygon (minimum 3 points)
         onPolygonCreate(currentPoints);
-        setCurrentPoints([]);
-        setIsDrawing(false);
+        stopDrawing();
       } else {
         setCurrentPoints([...currentPoints, newPoint]);
       }
@@ -94,70 +235,88 @@ export default function PolygonEditor({
 
   // Handle mouse move for drawing preview and vertex dragging
   const handleMouseMove = (e: React.MouseEvent) => {
-    if (draggedVertex) {
-      const newPoint = getMousePercent(e);
-      const polygon = polygons.find((p) => p.id === draggedVertex.polygonId);
-      if (polygon) {
-        const newPoints = [...polygon.points];
-        newPoints[draggedVertex.vertexIndex] = newPoint;
-        onPolygonUpdate(draggedVertex.polygonId, newPoints);
-      }
-    }
+    if (!dragRef.current && !isDrawing) return;
+    pointerScheduler.schedule({ raw: getMousePercent(e), free: e.altKey });
   };
 
-  // Handle mouse up to stop dragging
+  // Handle mouse up to stop dragging and commit the edited polygon
   const handleMouseUp = () => {
-    setDraggedVertex(null);
+    const drag = dragRef.current;
+    if (!drag) return;
+    pointerScheduler.flush();
+    dragRef.current = null;
+    setDragPoints(null);
+    setSnapTarget(null);
+    if (!samePoints(drag.before, drag.points)) {
+      historyRef.current.push({ id: drag.polygonId, before: drag.before, after: drag.points });
+      onPolygonUpdate(drag.polygonId, drag.points);
+    }
   };
 
-  // Handle vertex drag start
-  const handleVertexMouseDown = (e: React.MouseEvent, polygonId: string, vertexIndex: number) => {
+  // Handle vertex drag start (stable so memoized polygons don't re-render)
+  const polygonsRef = useRef(polygons);
+  polygonsRef.current = polygons;
+  const handleVertexMouseDown = useCallback((e: React.MouseEvent, polygonId: string, vertexIndex: number) => {
     e.stopPropagation();
-    setDraggedVertex({ polygonId, vertexIndex });
-  };
+    const polygon = polygonsRef.current.find((p) => p.id === polygonId);
+    if (!polygon) return;
+    dragRef.current = { polygonId, vertexIndex, before: polygon.points, points: polygon.points };
+    setDragPoints(polygon.points);
+  }, []);
 
-  // Handle escape key to cancel drawing
+  // Keyboard: Escape cancels, Delete removes, Ctrl+Z / Ctrl+Shift+Z (Ctrl+Y) undo and redo
   useEffect(() => {
     const handleKeyDown = (e: KeyboardEvent) => {
+      const active = document.activeElement;
+      const isTyping =
+        active &&
+        (active.tagName === "INPUT" ||
+          active.tagName === "TEXTAREA" ||
+          active.tagName === "SELECT" ||
+          (active as HTMLElement).isContentEditable);
+
       if (e.key === "Escape") {
         if (isDrawing) {
           setCurrentPoints([]);
           setIsDrawing(false);
+          setHoverPoint(null);
+          setSnapTarget(null);
         } else {
           onPolygonSelect(null);
         }
       }
       if (e.key === "Delete" || e.key === "Backspace") {
-        const active = document.activeElement;
-        const isTyping =
-          active &&
-          (active.tagName === "INPUT" ||
-            active.tagName === "TEXTAREA" ||
-            active.tagName === "SELECT" ||
-            (active as HTMLElement).isContentEditable);
         if (!isTyping && selectedId && !isDrawing) {
           onPolygonDelete(selectedId);
         }
       }
+      if ((e.ctrlKey || e.metaKey) && !isTyping && !dragRef.current) {
+        const key = e.key.toLowerCase();
+        const isUndo = key === "z" && !e.shiftKey;
+        const isRedo = (key === "z" && e.shiftKey) || key === "y";
+        if (!isUndo && !isRedo) return;
+        e.preventDefault();
+        if (isDrawing) {
+          // While drawing, undo removes the last placed point
+          if (isUndo) setCurrentPoints((prev) => prev.slice(0, -1));
+          return;
+        }
+        // Skip entries for polygons that have been deleted since
+        const exists = (id: string) => polygonsRef.current.some((p) => p.id === id);
+        const step = () => (isUndo ? historyRef.current.undo() : historyRef.current.redo());
+        let entry = step();
+        while (entry && !exists(entry.id)) entry = step();
+        if (entry) {
+          onPolygonUpdate(entry.id, isUndo ? entry.before : entry.after);
+          onPolygonSelect(entry.id);
+        }
+      }
     };
     window.addEventListener("keydown", handleKeyDown);
     return () => window.removeEventListener("keydown", handleKeyDown);
-  }, [isDrawing, selectedId, onPolygonSelect, onPolygonDelete]);
-
-  // Build SVG path directly from percentage points (viewBox is 0 0 100 100)
-  const getPathString = (points: Point[]) => {
-    if (points.length < 2) return "";
-    return points
-      .map((p, i) => `${i === 0 ? "M" : "L"} ${p.x} ${p.y}`)
-      .join(" ") + " Z";
-  };
+  }, [isDrawing, selectedId, onPolygonSelect, onPolygonDelete, onPolygonUpdate]);
 
-  // Get color for polygon based on status
-  const getPolygonColor = (polygon: Polygon, isSelected: boolean) => {
-    if (isSelected) return "rgba(59, 130, 246, 0.5)"; // Blue when selected
-    if (polygon.color) return polygon.color;
-    return "rgba(34, 197, 94, 0.4)"; // Default green
-  };
+  const draggingId = dragPoints ? dragRef.current?.polygonId : undefined;
 
   return (
     <div className="relative">
@@ -174,10 +333,7 @@ export default function PolygonEditor({
         )}
         {isDrawing && (
           <button
-            onClick={() => {
-              setCurrentPoints([]);
-              setIsDrawing(false);
-            }}
+            onClick={stopDrawing}
             className="bg-red-500 text-white px-3 py-1.5 rounded-lg text-sm font-medium shadow-lg hover:bg-red-600"
           >
             Bekor (Esc)
@@ -216,64 +372,23 @@ export default function PolygonEditor({
           preserveAspectRatio="none"
           style={{ pointerEvents: "none" }}
         >
-          {polygons.map((polygon) => {
-            const isSelected = polygon.id === selectedId;
-            const cx = polygon.points.reduce((s, p) => s + p.x, 0) / polygon.points.length;
-            const cy = polygon.points.reduce((s, p) => s + p.y, 0) / polygon.points.length;
-            return (
-              <g key={polygon.id}>
-                <path
-                  d={getPathString(polygon.points)}
-                  fill={getPolygonColor(polygon, isSelected)}
-                  stroke={isSelected ? "#2563eb" : "#16a34a"}
-                  strokeWidth={isSelected ? 0.6 : 0.4}
-                  vectorEffect="non-scaling-stroke"
-                  style={{ pointerEvents: "all", cursor: "pointer" }}
-                  data-polygon-id={polygon.id}
-                />
-
-                {/* Vertices — shown when selected */}
-                {isSelected &&
-                  polygon.points.map((point, i) => (
-                    <circle
-                      key={i}
-                      cx={point.x}
-                      cy={point.y}
-                      r={1.2}
-                      fill="white"
-                      stroke="#2563eb"
-                      strokeWidth={0.4}
-                      vectorEffect="non-scaling-stroke"
-                      style={{ pointerEvents: "all", cursor: "move" }}
-                      onMouseDown={(e) => handleVertexMouseDown(e, polygon.id, i)}
-                    />
-                  ))}
-
-                {/* Label — show unit number */}
-                {polygon.points.length > 0 && (
-                  <text
-                    x={cx}
-                    y={cy}
-                    textAnchor="middle"
-                    dominantBaseline="middle"
-                    fontSize="3"
-                    fontWeight="bold"
-                    fill="#1e293b"
-                    vectorEffect="non-scaling-stroke"
-                    style={{ pointerEvents: "none" }}
-                  >
-                    {polygon.label || ""}
-                  </text>
-                )}
-              </g>
-            );
-          })}
+          {polygons.map((polygon) => (
+            <PolygonShape
+              key={polygon.id}
+              polygon={polygon}
+              points={polygon.id === draggingId && dragPoints ? dragPoints : polygon.points}
+              isSelected={polygon.id === selectedId}
+              onVertexMouseDown={handleVertexMouseDown}
+            />
+          ))}
 
           {/* In-progress drawing */}
           {currentPoints.length > 0 && (
             <g>
               <path
-                d={currentPoints.map((p, i) => `${i === 0 ? "M" : "L"} ${p.x} ${p.y}`).join(" ")}
+                d={[...currentPoints, ...(hoverPoint ? [hoverPoint] : [])]
+                  .map((p, i) => `${i === 0 ? "M" : "L"} ${p.x} ${p.y}`)
+                  .join(" ")}
                 fill="none"
                 stroke="#9333ea"
                 strokeWidth={0.4}
@@ -294,6 +409,19 @@ export default function PolygonEditor({
               ))}
             </g>
           )}
+
+          {/* Snap indicator */}
+          {snapTarget && (
+            <circle
+              cx={snapTarget.point.x}
+              cy={snapTarget.point.y}
+              r={snapTarget.kind === "vertex" ? 1.6 : 1}
+              fill="none"
+              stroke="#f97316"
+              strokeWidth={0.4}
+              vectorEffect="non-scaling-stroke"
+            />
+          )}
         </svg>
       </div>
 
@@ -301,6 +429,7 @@ export default function PolygonEditor({
       <div className="mt-3 text-sm text-slate-500">
         <p><strong>Chizish:</strong> Nuqta qo‘shish uchun bosing, yopish uchun birinchi nuqtaga qaytib bosing</p>
         <p><strong>Tahrirlash:</strong> Nuqtalarni sudrab o‘zgartiring • <strong>O‘chirish:</strong> Tanlang + Delete tugmasi</p>
+        <p><strong>Yopishish:</strong> Yaqin nuqta va chiziqlarga avtomatik yopishadi (Alt — erkin) • <strong>Ortga/Oldinga:</strong> Ctrl+Z / Ctrl+Shift+Z</p>
       </div>
     </div>
   );
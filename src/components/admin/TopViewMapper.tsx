@@ -1,7 +1,8 @@
 "use client";
 
-import { useEffect, useRef, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import Image from "next/image";
+import { createFrameScheduler } from "@/lib/polygon-editor";
 
 type Point = { x: number; y: number };
 
@@ -37,6 +38,24 @@ export default function TopViewMapper({ imageUrl, buildings, onClose, onSaved }:
   const [draggingLabelId, setDraggingLabelId] = useState<string | null>(null);
   const [draggingPointId, setDraggingPointId] = useState<string | null>(null);
 
+  // Label/point drags update state at most once per animation frame
+  const dragScheduler = useMemo(
+    () =>
+      createFrameScheduler<{ kind: "label" | "point"; id: string; pt: Point }>(({ kind, id, pt }) => {
+        if (kind === "label") setLabelPositions((prev) => ({ ...prev, [id]: pt }));
+        else setPointPositions((prev) => ({ ...prev, [id]: pt }));
+      }),
+    []
+  );
+
+  useEffect(() => () => dragScheduler.cancel(), [dragScheduler]);
+
+  const stopDragging = () => {
+    dragScheduler.flush();
+    setDraggingLabelId(null);
+    setDraggingPointId(null);
+  };
+
   useEffect(() => {
     const initial: Record<string, Point[]> = {};
     for (const b of buildings) {
@@ -158,6 +177,17 @@ export default function TopViewMapper({ imageUrl, buildings, onClose, onSaved }:
           labelScale: labelScales[b.id] || 1.0,
         };
 
+        // Only send buildings that actually changed
+        const saved = {
+          polygonData: b.polygonData && Array.isArray(b.polygonData) && b.polygonData.length >= 3 ? b.polygonData : null,
+          labelX: b.labelX ?? null,
+          labelY: b.labelY ?? null,
+          pointX: b.pointX ?? null,
+          pointY: b.pointY ?? null,
+          labelScale: b.labelScale || 1.0,
+        };
+        if (JSON.stringify(body) === JSON.stringify(saved)) return;
+
         await fetch(`/api/buildings/${b.id}`, {
           method: "PUT",
           headers: { "Content-Type": "application/json" },
@@ -198,21 +228,13 @@ export default function TopViewMapper({ imageUrl, buildings, onClose, onSaved }:
                 preserveAspectRatio="none"
                 onMouseMove={(e) => {
                   if (draggingLabelId) {
-                    const pt = getPoint(e);
-                    setLabelPositions(prev => ({ ...prev, [draggingLabelId]: pt }));
+                    dragScheduler.schedule({ kind: "label", id: draggingLabelId, pt: getPoint(e) });
                   } else if (draggingPointId) {
-                    const pt = getPoint(e);
-                    setPointPositions(prev => ({ ...prev, [draggingPointId]: pt }));
+                    dragScheduler.schedule({ kind: "point", id: draggingPointId, pt: getPoint(e) });
                   }
                 }}
-                onMouseUp={() => {
-                  setDraggingLabelId(null);
-                  setDraggingPointId(null);
-                }}
-                onMouseLeave={() => {
-                  setDraggingLabelId(null);
-                  setDraggingPointId(null);
-                }}
+                onMouseUp={stopDragging}
+                onMouseLeave={stopDragging}
               >
                 {/* Completed polygons */}
                 {Object.entries(polygons).map(([id, pts]) => {
@@ -0,0 +1,52 @@
+"use client";
+
+import { useState, useEffect, useRef, useCallback } from "react";
+
+/**
+ * Windowing for long fixed-height lists: only the rows inside the
+ * scroll viewport (plus a small overscan) are rendered.
+ */
+export function useVirtualRows(count: number, rowHeight: number, overscan = 8) {
+  const containerRef = useRef<HTMLDivElement>(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(600);
+
+  // The scroll container may only mount once there are rows to show
+  const hasRows = count > 0;
+  useEffect(() => {
+    const el = containerRef.current;
+    if (!el) return;
+    const observer = new ResizeObserver(() => setViewportHeight(el.clientHeight));
+    observer.observe(el);
+    setViewportHeight(el.clientHeight);
+    // A remounted container starts scrolled to the top
+    setScrollTop(el.scrollTop);
+    return () => observer.disconnect();
+  }, [hasRows]);
+
+  const onScroll = useCallback((e: React.UIEvent<HTMLDivElement>) => {
+    setScrollTop(e.currentTarget.scrollTop);
+  }, []);
+
+  const start = Math.max(0, Math.floor(scrollTop / rowHeight) - overscan);
+  const end = Math.min(count, Math.ceil((scrollTop + viewportHeight) / rowHeight) + overscan);
+
+  // Keep a row visible, e.g. when moving through the list with the keyboard
+  const scrollToIndex = useCallback((index: number) => {
+    const el = containerRef.current;
+    if (!el) return;
+    const top = index * rowHeight;
+    if (top < el.scrollTop) el.scrollTop = top;
+    else if (top + rowHeight > el.scrollTop + el.clientHeight) el.scrollTop = top + rowHeight - el.clientHeight;
+  }, [rowHeight]);
+
+  return {
+    containerRef,
+    onScroll,
+    start,
+    end,
+    totalHeight: count * rowHeight,
+    offsetTop: start * rowHeight,
+    scrollToIndex,
+  };
+}
@@ -1,11 +1,22 @@
 import { unstable_cache } from "next/cache";
 import { Prisma } from "@prisma/client";
-import prisma from "./prisma";
+import prisma, { DbClient, readClient, sessionWroteRecently } from "./prisma";
+
+// Cached reads are served from the replica. A session that just wrote
+// bypasses the shared cache and reads from the primary, so it sees its own change.
+function cachedRead<T>(
+  query: (db: DbClient) => Promise<T>,
+  keyParts: string[],
+  options: { revalidate: number; tags: string[] }
+) {
+  const cached = unstable_cache(() => query(readClient()), keyParts, options);
+  return async (): Promise<T> => (sessionWroteRecently() ? query(prisma) : cached());
+}
 
 // Cache project data for 60 seconds (matches ISR revalidation)
-export const getCachedProject = unstable_cache(
-  async () => {
-    return prisma.project.findFirst({
+export const getCachedProject = cachedRead(
+  async (db) => {
+    return db.project.findFirst({
       include: {
         buildings: {
           include: {
@@ -23,9 +34,9 @@ export const getCachedProject = unstable_cache(
 );
 
 // Cache project with only polygon units (for apartments page)
-export const getCachedProjectWithPolygonUnits = unstable_cache(
-  async () => {
-    return prisma.project.findFirst({
+export const getCachedProjectWithPolygonUnits = cachedRead(
+  async (db) => {
+    return db.project.findFirst({
       include: {
         buildings: {
           include: {
@@ -49,9 +60,9 @@ export const getCachedProjectWithPolygonUnits = unstable_cache(
 );
 
 // Cache hero images
-export const getCachedHeroImages = unstable_cache(
-  async () => {
-    return prisma.heroImage.findMany({
+export const getCachedHeroImages = cachedRead(
+  async (db) => {
+    return db.heroImage.findMany({
       orderBy: { sortOrder: "asc" },
     });
   },
@@ -60,9 +71,9 @@ export const getCachedHeroImages = unstable_cache(
 );
 
 // Cache FAQs
-export const getCachedFAQs = unstable_cache(
-  async () => {
-    return prisma.fAQ.findMany({
+export const getCachedFAQs = cachedRead(
+  async (db) => {
+    return db.fAQ.findMany({
       where: { isActive: true },
       orderBy: { sortOrder: "asc" },
     });
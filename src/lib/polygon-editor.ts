@@ -0,0 +1,199 @@
+// Helpers for the admin polygon editors (floor plans and top view).
+// All coordinates are percentages (0-100) of the image size.
+
+type Point = { x: number; y: number };
+
+export interface SnapTarget {
+  point: Point;
+  kind: "vertex" | "edge";
+}
+
+/**
+ * Coalesce high-frequency updates (pointer moves) into at most one call per animation frame.
+ * Only the latest scheduled value is delivered.
+ */
+export function createFrameScheduler<T>(callback: (value: T) => void) {
+  let frame: number | null = null;
+  let latest: T;
+
+  return {
+    schedule(value: T) {
+      latest = value;
+      if (frame !== null) return;
+      frame = requestAnimationFrame(() => {
+        frame = null;
+        callback(latest);
+      });
+    },
+    // Deliver a pending value right away (e.g. on mouse up)
+    flush() {
+      if (frame === null) return;
+      cancelAnimationFrame(frame);
+      frame = null;
+      callback(latest);
+    },
+    cancel() {
+      if (frame !== null) cancelAnimationFrame(frame);
+      frame = null;
+    },
+  };
+}
+
+interface IndexedVertex {
+  point: Point;
+  owner: string;
+  index: number;
+}
+
+interface IndexedEdge {
+  a: Point;
+  b: Point;
+  owner: string;
+  from: number;
+  to: number;
+}
+
+const distance = (a: Point, b: Point) => Math.hypot(a.x - b.x, a.y - b.y);
+
+function closestOnSegment(p: Point, a: Point, b: Point): Point {
+  const dx = b.x - a.x;
+  const dy = b.y - a.y;
+  const lengthSq = dx * dx + dy * dy;
+  if (lengthSq === 0) return a;
+  const t = Math.max(0, Math.min(1, ((p.x - a.x) * dx + (p.y - a.y) * dy) / lengthSq));
+  return { x: a.x + t * dx, y: a.y + t * dy };
+}
+
+/**
+ * Uniform grid over the 0-100 canvas for finding nearby vertices and edges
+ * without scanning every polygon on each pointer move.
+ */
+export class SnapIndex {
+  private vertices = new Map<string, IndexedVertex[]>();
+  private edges = new Map<string, IndexedEdge[]>();
+
+  constructor(polygons: { id: string; points: Point[] }[], private cellSize = 5) {
+    for (const polygon of polygons) {
+      const pts = polygon.points;
+      pts.forEach((point, i) => {
+        this.add(this.vertices, this.cell(point.x), this.cell(point.y), { point, owner: polygon.id, index: i });
+
+        if (pts.length < 2) return;
+        const next = (i + 1) % pts.length;
+        const edge = { a: point, b: pts[next], owner: polygon.id, from: i, to: next };
+        // An edge is stored in every cell its bounding box touches
+        for (let cx = this.cell(Math.min(point.x, pts[next].x)); cx <= this.cell(Math.max(point.x, pts[next].x)); cx++) {
+          for (let cy = this.cell(Math.min(point.y, pts[next].y)); cy <= this.cell(Math.max(point.y, pts[next].y)); cy++) {
+            this.add(this.edges, cx, cy, edge);
+          }
+        }
+      });
+    }
+  }
+
+  /**
+   * Nearest vertex within `radius`, otherwise the nearest point on an edge, otherwise null.
+   * `skip` excludes a vertex (and its two edges) of the polygon being edited.
+   */
+  snap(p: Point, radius: number, skip?: { id: string; vertex: number }): SnapTarget | null {
+    let best: SnapTarget | null = null;
+    let bestDistance = radius;
+
+    for (const v of this.nearby(this.vertices, p, radius)) {
+      if (skip && v.owner === skip.id && v.index === skip.vertex) continue;
+      const d = distance(p, v.point);
+      if (d <= bestDistance) {
+        best = { point: v.point, kind: "vertex" };
+        bestDistance = d;
+      }
+    }
+    if (best) return best;
+
+    for (const e of this.nearby(this.edges, p, radius)) {
+      if (skip && e.owner === skip.id && (e.from === skip.vertex || e.to === skip.vertex)) continue;
+      const q = closestOnSegment(p, e.a, e.b);
+      const d = distance(p, q);
+      if (d <= bestDistance) {
+        best = { point: q, kind: "edge" };
+        bestDistance = d;
+      }
+    }
+    return best;
+  }
+
+  private cell(value: number) {
+    return Math.floor(value / this.cellSize);
+  }
+
+  private add<T>(map: Map<string, T[]>, cx: number, cy: number, item: T) {
+    const key = `${cx}:${cy}`;
+    const bucket = map.get(key);
+    if (bucket) bucket.push(item);
+    else map.set(key, [item]);
+  }
+
+  private nearby<T>(map: Map<string, T[]>, p: Point, radius: number): T[] {
+    const items: T[] = [];
+    for (let cx = this.cell(p.x - radius); cx <= this.cell(p.x + radius); cx++) {
+      for (let cy = this.cell(p.y - radius); cy <= this.cell(p.y + radius); cy++) {
+        const bucket = map.get(`${cx}:${cy}`);
+        if (bucket) items.push(...bucket);
+      }
+    }
+    return items;
+  }
+}
+
+export interface HistoryEntry {
+  id: string;
+  before: Point[];
+  after: Point[];
+}
+
+/**
+ * Bounded undo/redo stack. Each entry holds only the polygon that changed,
+ * not a snapshot of the whole floor.
+ */
+export class EditHistory {
+  private undoStack: HistoryEntry[] = [];
+  private redoStack: HistoryEntry[] = [];
+
+  constructor(private limit = 100) {}
+
+  push(entry: HistoryEntry) {
+    this.undoStack.push(entry);
+    if (this.undoStack.length > this.limit) this.undoStack.shift();
+    this.redoStack = [];
+  }
+
+  undo(): HistoryEntry | undefined {
+    const entry = this.undoStack.pop();
+    if (entry) this.redoStack.push(entry);
+    return entry;
+  }
+
+  redo(): HistoryEntry | undefined {
+    const entry = this.redoStack.pop();
+    if (entry) this.undoStack.push(entry);
+    return entry;
+  }
+
+  clear() {
+    this.undoStack = [];
+    this.redoStack = [];
+  }
+}
+
+export function samePoints(a: Point[] | undefined, b: Point[] | undefined): boolean {
+  if (a === b) return true;
+  if (!a || !b || a.length !== b.length) return false;
+  return a.every((p, i) => p.x === b[i].x && p.y === b[i].y);
+}
+
+// Polygons whose points differ from the last saved copy — only these need to be sent
+export function changedPolygons<T extends { id: string; points: Point[] }>(
+  saved: Record<string, Point[]>,
+  current: T[]
+): T[] {
+  return current.filter((p) => !samePoints(saved[p.id], p.points));
+}
@@ -1,11 +1,136 @@
 import { PrismaClient } from "@prisma/client";
+import { cookies } from "next/headers";
+import { PRIMARY_COOKIE, STICKY_MS } from "./read-routing";
 
-const globalForPrisma = globalThis as unknown as { prisma: PrismaClient };
+const WRITE_OPERATIONS = new Set([
+  "create",
+  "createMany",
+  "update",
+  "updateMany",
+  "upsert",
+  "delete",
+  "deleteMany",
+]);
+
+// Models that no cached or shared read depends on. Writes to them (e.g. a visitor
+// submitting a lead) must not pull this instance's shared reads off the replica.
+const UNCACHED_MODELS = new Set(["Lead", "User"]);
+
+// Remember when this server instance last wrote, so cache refills right after a
+// write (revalidateTag) read from the primary instead of a lagging replica
+function createClient(datasourceUrl?: string) {
+  return new PrismaClient(datasourceUrl ? { datasourceUrl } : undefined).$extends({
+    query: {
+      $allModels: {
+        async $allOperations({ model, operation, args, query }) {
+          const result = await query(args);
+          if (WRITE_OPERATIONS.has(operation) && !UNCACHED_MODELS.has(model)) {
+            globalForPrisma.lastWriteAt = Date.now();
+          }
+          return result;
+        },
+      },
+    },
+  });
+}
+
+export type DbClient = ReturnType<typeof createClient>;
+
+const globalForPrisma = globalThis as unknown as {
+  prisma: DbClient;
+  prismaReplica: DbClient;
+  lastWriteAt: number;
+};
 
 export const prisma =
   globalForPrisma.prisma ||
-  new PrismaClient();
+  createClient();
+
+// Read-only replica (Postgres read replica / read pool). Same as the primary when not configured.
+export const prismaReplica = process.env.DATABASE_REPLICA_URL
+  ? globalForPrisma.prismaReplica || createClient(process.env.DATABASE_REPLICA_URL)
+  : prisma;
+
+if (process.env.NODE_ENV !== "production") {
+  globalForPrisma.prisma = prisma;
+  globalForPrisma.prismaReplica = prismaReplica;
+}
+
+// True when the current request comes from a browser that wrote recently (cookie set by middleware)
+export function sessionWroteRecently(): boolean {
+  try {
+    return parseInt(cookies().get(PRIMARY_COOKIE)?.value || "0") > Date.now();
+  } catch {
+    // Outside a request scope, e.g. inside unstable_cache or at build time
+    return false;
+  }
+}
+
+/**
+ * Client for read-only queries that are shared between visitors (safe inside unstable_cache).
+ * Uses the replica unless this instance wrote within the last STICKY_MS.
+ */
+export function readClient(): DbClient {
+  if (Date.now() - (globalForPrisma.lastWriteAt || 0) < STICKY_MS) return prisma;
+  return prismaReplica;
+}
+
+/**
+ * Client for read-only queries rendered for the current request.
+ * Also keeps a session that just made a change on the primary (read-your-writes).
+ */
+export function sessionReadClient(): DbClient {
+  return sessionWroteRecently() ? prisma : readClient();
+}
+
+/**
+ * Report how far the replica is behind the primary.
+ *
+ * For a streaming replica the lag is the age of the last replayed transaction
+ * (zero when everything received has been replayed). A copy that is synced by
+ * hand is not in recovery, so it falls back to comparing the latest unit write on
+ * each side — that is only the time between those writes, not replication delay.
+ */
+export async function getReplicaStatus() {
+  if (prismaReplica === prisma) {
+    return { replica: false, method: null, lagMs: 0, stickyMs: STICKY_MS };
+  }
+
+  const [replay] = await prismaReplica.$queryRaw<{ inRecovery: boolean; lagMs: number | null }[]>`
+    SELECT pg_is_in_recovery() AS "inRecovery",
+      CASE
+        WHEN NOT pg_is_in_recovery() THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) * 1000
+      END::float8 AS "lagMs"`;
+
+  let status;
+  if (replay.inRecovery) {
+    status = { replica: true, method: "replay", lagMs: replay.lagMs === null ? null : Math.round(replay.lagMs) };
+  } else {
+    const latest = (db: DbClient) =>
+      db.unit.findFirst({ orderBy: { updatedAt: "desc" }, select: { updatedAt: true } });
+    const [primary, replica] = await Promise.all([latest(prisma), latest(prismaReplica)]);
+
+    let lagMs: number | null = 0;
+    if (primary && replica) lagMs = Math.max(0, primary.updatedAt.getTime() - replica.updatedAt.getTime());
+    else if (primary) lagMs = null; // Replica has no units yet
+
+    status = {
+      replica: true,
+      method: "latest-unit-write",
+      lagMs,
+      primaryLatestWrite: primary?.updatedAt ?? null,
+      replicaLatestWrite: replica?.updatedAt ?? null,
+    };
+  }
+
+  if (status.lagMs === null || status.lagMs > STICKY_MS) {
+    const lag = status.lagMs === null ? "unknown" : `${status.lagMs}ms`;
+    console.warn(`Replica lag ${lag} exceeds read-your-writes window (${STICKY_MS}ms)`);
+  }
 
-if (process.env.NODE_ENV !== "production") globalForPrisma.prisma = prisma;
+  return { ...status, stickyMs: STICKY_MS };
+}
 
 export default prisma;
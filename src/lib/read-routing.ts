@@ -0,0 +1,7 @@
+// Shared by the middleware (edge runtime) and the Prisma clients — keep this file free of server-only imports.
+
+// Cookie holding a timestamp until which this browser's reads go to the primary database
+export const PRIMARY_COOKIE = "db-primary-until";
+
+// How long reads stay on the primary after a write; should exceed the usual replica lag
+export const STICKY_MS = parseInt(process.env.REPLICA_STICKY_MS || "5000");
@@ -1,8 +1,12 @@
 import { NextResponse } from "next/server";
 import type { NextRequest } from "next/server";
+import { PRIMARY_COOKIE, STICKY_MS } from "@/lib/read-routing";
 
 const supportedLocales = ["uz", "ru", "en"] as const;
 
+// Default NextAuth session cookie names (the secure variant is used over HTTPS)
+const SESSION_COOKIES = ["next-auth.session-token", "__Secure-next-auth.session-token"];
+
 /**
  * Detect the best locale from the browser's Accept-Language header.
  * Maps language codes like "ru", "ru-RU", "en-US" to our supported locales.
@@ -38,6 +42,24 @@ function detectLocale(acceptLanguage: string | null): string {
 export function middleware(request: NextRequest) {
   const response = NextResponse.next();
 
+  if (request.nextUrl.pathname.startsWith("/api")) {
+    // After an admin write, keep this browser's reads on the primary database long enough
+    // to see its own change even if the replica is still catching up. Anonymous writes
+    // (e.g. lead forms) and NextAuth's own requests keep using the replica and shared cache.
+    const isMutation = !["GET", "HEAD", "OPTIONS"].includes(request.method);
+    const isAuthRoute = request.nextUrl.pathname.startsWith("/api/auth");
+    const hasSession = SESSION_COOKIES.some((name) => request.cookies.has(name));
+    if (isMutation && hasSession && !isAuthRoute) {
+      response.cookies.set(PRIMARY_COOKIE, String(Date.now() + STICKY_MS), {
+        path: "/",
+        maxAge: Math.ceil(STICKY_MS / 1000),
+        httpOnly: true,
+        sameSite: "lax",
+      });
+    }
+    return response;
+  }
+
   // If no locale cookie exists, detect from browser language
   if (!request.cookies.get("locale")) {
     const acceptLanguage = request.headers.get("accept-language");
@@ -54,7 +76,7 @@ export function middleware(request: NextRequest) {
 
 export const config = {
   matcher: [
-    // Match all paths except static files and api
-    "/((?!_next/static|_next/image|favicon.ico|uploads|api).*)",
+    // Match all paths except static files
+    "/((?!_next/static|_next/image|favicon.ico|uploads).*)",
   ],
 };